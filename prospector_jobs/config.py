@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
 
 @dataclass
 class Config:
@@ -48,5 +47,13 @@ class Config:
         return bool(self.slack_webhook_url) or bool(self.slack_bot_token)
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
+    """Return the process-wide config, reading ``.env`` and the environment only once.
+
+    ``.env`` is loaded here rather than at import time, so importing the
+    package (e.g. in tests or worker processes) never touches the filesystem.
+    Call ``get_config.cache_clear()`` to pick up environment changes.
+    """
+    load_dotenv()
     return Config()
@@ -15,7 +15,8 @@ def deduplicate(postings: list[JobPosting]) -> list[JobPosting]:
 
     for posting in postings:
         key = posting.dedup_key
-        if key not in seen or posting.score > seen[key].score:
+        current = seen.get(key)
+        if current is None or posting.score > current.score:
             seen[key] = posting
 
     return list(seen.values())
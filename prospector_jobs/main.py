@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
 import logging
 import sys
+from collections.abc import Coroutine
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, TypeVar
 
-from .config import get_config
+import httpx
+
+from .config import Config, get_config
 from .dedup import deduplicate
 from .models import JobPosting
-from .notifier import notify_slack
-from .scorer import score_posting
+from .notifier import notify_slack, tier_emoji
+from .scorer import score_postings
 from .scrapers import AboveboardScraper, IndeedScraper, LinkedInScraper, WellfoundScraper
 from .storage import append_postings
 
@@ -21,21 +29,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Number of postings shown in the terminal summary
+SUMMARY_TOP_N = 20
+
+# Terminal summary markers: _SUMMARY_EMOJIS[i] applies from _SUMMARY_THRESHOLDS[i - 1] up
+_SUMMARY_THRESHOLDS = (50, 70)
+_SUMMARY_EMOJIS = ("  ", "⭐", "🔥")
+
+# Below this many postings, worker start-up costs more than parallel scoring saves
+PROCESS_POOL_MIN_POSTINGS = 200
+SCORE_CHUNK_SIZE = 64
+
+
+def _summary_emoji(score: int) -> str:
+    """Marker for the terminal summary (coarser than the Slack tiers; blank below 50)."""
+    return _SUMMARY_EMOJIS[bisect.bisect_right(_SUMMARY_THRESHOLDS, score)]
+
+
+async def _score_all(postings: list[JobPosting], now: datetime, pool: Executor) -> None:
+    """Score postings in place, fanning large batches out to ``pool``."""
+    if len(postings) < PROCESS_POOL_MIN_POSTINGS:
+        scores = score_postings(postings, now)
+    else:
+        loop = asyncio.get_running_loop()
+        chunks = [
+            postings[i : i + SCORE_CHUNK_SIZE] for i in range(0, len(postings), SCORE_CHUNK_SIZE)
+        ]
+        batches = await asyncio.gather(
+            *(loop.run_in_executor(pool, score_postings, chunk, now) for chunk in chunks)
+        )
+        scores = [score for batch in batches for score in batch]
+
+    for posting, score in zip(postings, scores):
+        posting.score = score
+        posting.tier_emoji = tier_emoji(score)
+
 
 async def run() -> list[JobPosting]:
     """Run the full prospecting pipeline."""
-    config = get_config()
+    # One connection pool shared by every scraper and the Slack notifier; HTTP/2
+    # lets the concurrent searches against one host share a single connection
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as client:
+        return await _run(get_config(), client)
 
+
+async def _run(config: Config, client: httpx.AsyncClient) -> list[JobPosting]:
     # Build list of enabled scrapers
+    delay = config.request_delay
     scrapers = []
     if config.scraper_linkedin:
-        scrapers.append(LinkedInScraper(serpapi_key=config.serpapi_key, delay=config.request_delay))
+        scrapers.append(LinkedInScraper(serpapi_key=config.serpapi_key, delay=delay, client=client))
     if config.scraper_indeed:
-        scrapers.append(IndeedScraper(delay=config.request_delay))
+        scrapers.append(IndeedScraper(delay=delay, client=client))
     if config.scraper_aboveboard:
-        scrapers.append(AboveboardScraper(delay=config.request_delay))
+        scrapers.append(AboveboardScraper(delay=delay, client=client))
     if config.scraper_wellfound:
-        scrapers.append(WellfoundScraper(delay=config.request_delay))
+        scrapers.append(WellfoundScraper(delay=delay, client=client))
 
     if not scrapers:
         logger.warning("No scrapers enabled!")
@@ -43,26 +98,26 @@ async def run() -> list[JobPosting]:
 
     logger.info("Running %d scrapers...", len(scrapers))
 
-    # Run all scrapers concurrently
-    results = await asyncio.gather(*[s.safe_scrape() for s in scrapers])
-
-    # Flatten results
+    # Run all scrapers concurrently, scoring each batch as soon as its scraper
+    # finishes so scoring overlaps with the slower scrapers' network I/O
+    # One reference time so every batch's freshness is measured from the same instant
+    now = datetime.now(UTC)
     all_postings: list[JobPosting] = []
-    for batch in results:
-        all_postings.extend(batch)
+    # One pool for the run; workers only start if a batch is big enough to use them
+    with ProcessPoolExecutor() as pool:
+        for next_batch in asyncio.as_completed([s.safe_scrape() for s in scrapers]):
+            batch = await next_batch
+            await _score_all(batch, now, pool)
+            all_postings.extend(batch)
 
-    logger.info("Collected %d raw postings", len(all_postings))
-
-    # Score each posting
-    for posting in all_postings:
-        posting.score = score_posting(posting)
+    logger.info("Collected and scored %d raw postings", len(all_postings))
 
     # Deduplicate
     unique = deduplicate(all_postings)
     logger.info("After dedup: %d unique postings", len(unique))
 
-    # Sort by score
-    unique.sort(key=lambda p: p.score, reverse=True)
+    # Only the summary needs ordering, and only its top N
+    top = heapq.nlargest(SUMMARY_TOP_N, unique, key=lambda p: p.score)
 
     # Notify via Slack
     if config.has_slack:
@@ -73,34 +128,44 @@ async def run() -> list[JobPosting]:
             channel_id=config.slack_channel_id,
             min_score=config.min_score,
             total_scanned=len(all_postings),
+            client=client,
         )
         logger.info("Sent %d Slack notifications", sent)
 
     # Store results
-    all_stored = append_postings(unique, config.storage_path)
-    logger.info("Total stored postings: %d", len(all_stored))
+    total_stored = append_postings(unique, config.storage_path)
+    logger.info("Total stored postings: %d", total_stored)
 
     # Print summary
     print("\n" + "=" * 60)
     print(f"  Prospector Results: {len(unique)} unique postings found")
     print("=" * 60)
-    for posting in unique[:20]:
-        emoji = "🔥" if posting.score >= 70 else "⭐" if posting.score >= 50 else "  "
+    for posting in top:
+        emoji = _summary_emoji(posting.score)
         print(f"  {emoji} [{posting.score:3d}] {posting.company} — {posting.title}")
         print(f"        {posting.source} | {posting.location or 'No location'}")
         print(f"        {posting.url}")
         print()
 
-    if len(unique) > 20:
-        print(f"  ... and {len(unique) - 20} more (see {config.storage_path})")
+    if len(unique) > SUMMARY_TOP_N:
+        print(f"  ... and {len(unique) - SUMMARY_TOP_N} more (see {config.storage_path})")
 
     return unique
 
 
+def _run_event_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on uvloop when it is installed (``[fast]`` extra), else stock asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 def main():
     """Entry point."""
     try:
-        postings = asyncio.run(run())
+        postings = _run_event_loop(run())
         logger.info("Done! Found %d postings.", len(postings))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
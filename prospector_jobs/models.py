@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class JobPosting:
     """A normalized job posting from any source."""
 
@@ -18,25 +21,56 @@ class JobPosting:
     location: str = ""
     description: str = ""
     score: int = 0
+    # Display tier for ``score``, cached by the pipeline when it assigns the score
+    tier_emoji: str = field(default="", repr=False, compare=False)
+    _dedup_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Sources, companies and locations ("Remote", "New York, NY") repeat heavily
+        # across scrapers; share one string each
+        self.source = sys.intern(self.source)
+        self.company = sys.intern(self.company)
+        self.location = sys.intern(self.location)
+        # Slotted instances have no __dict__ for cached_property, so precompute here.
+        # split()/join also collapses the runs of whitespace scraped text often has.
+        # Interned so equal keys are one object and dict probes match on identity.
+        company_norm = " ".join(self.company.lower().split())
+        title_norm = " ".join(self.title.lower().split())
+        self._dedup_key = sys.intern(f"{company_norm}|{title_norm}")
 
     @property
     def dedup_key(self) -> str:
         """Key for deduplication: normalized company + title."""
-        return f"{self.company.lower().strip()}|{self.title.lower().strip()}"
+        return self._dedup_key
 
-    def to_dict(self) -> dict:
-        """Serialize to dictionary for JSON storage."""
+    def _record(self) -> dict:
+        """The stored fields, with ``posted_date`` left as a datetime."""
         return {
             "title": self.title,
             "company": self.company,
             "url": self.url,
             "source": self.source,
-            "posted_date": self.posted_date.isoformat() if self.posted_date else None,
+            "posted_date": self.posted_date,
             "location": self.location,
             "description": self.description,
             "score": self.score,
         }
 
+    def to_dict(self) -> dict:
+        """Serialize to dictionary for JSON storage."""
+        record = self._record()
+        if self.posted_date:
+            record["posted_date"] = self.posted_date.isoformat()
+        return record
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes (one JSON Lines record).
+
+        Same record as ``to_dict``, but orjson encodes ``posted_date`` natively
+        (identical ISO 8601 output) instead of a per-posting ``isoformat()`` call.
+        """
+        return orjson.dumps(self._record())
+
     @classmethod
     def from_dict(cls, data: dict) -> JobPosting:
         """Deserialize from dictionary."""
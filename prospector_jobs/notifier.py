@@ -9,7 +9,11 @@ Supports Slack Bot Token + Channel ID (preferred) or webhook fallback.
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import heapq
 import logging
+from contextlib import AsyncExitStack
 
 import httpx
 
@@ -21,19 +25,19 @@ SLACK_API_URL = "https://slack.com/api/chat.postMessage"
 
 HOT_LEAD_THRESHOLD = 75
 DIGEST_TOP_N = 5
+# Above this many hot leads, alerts are packed into shared messages
+HOT_LEAD_BATCH_THRESHOLD = 3
+# Slack rejects messages with more than 50 blocks
+SLACK_MAX_BLOCKS = 50
 
+# Score tiers: _TIER_EMOJIS[i] applies from _TIER_THRESHOLDS[i - 1] up
+_TIER_THRESHOLDS = (45, 60, 75, 85)
+_TIER_EMOJIS = ("◻️", "📋", "⭐", "🔥", "🔥🔥")
 
-def _tier_emoji(score: int) -> str:
-    if score >= 85:
-        return "🔥🔥"
-    elif score >= 75:
-        return "🔥"
-    elif score >= 60:
-        return "⭐"
-    elif score >= 45:
-        return "📋"
-    else:
-        return "◻️"
+
+def tier_emoji(score: int) -> str:
+    """Emoji for a score tier in Slack messages."""
+    return _TIER_EMOJIS[bisect.bisect_right(_TIER_THRESHOLDS, score)]
 
 
 def format_hot_lead(posting: JobPosting) -> dict:
@@ -80,11 +84,28 @@ def format_hot_lead(posting: JobPosting) -> dict:
     }
 
 
+def format_hot_lead_batch(postings: list[JobPosting]) -> dict:
+    """Format several hot leads as one Slack message (one card per lead)."""
+    blocks: list[dict] = []
+    for posting in postings:
+        blocks.extend(format_hot_lead(posting)["blocks"])
+
+    companies = ", ".join(p.company for p in postings)
+    return {
+        "blocks": blocks,
+        "text": f"🔥 {len(postings)} Hot Leads: {companies}",
+    }
+
+
 def format_digest(postings: list[JobPosting], total_found: int) -> dict:
-    """Format top N leads as a single digest message."""
+    """Format top N leads as a single digest message.
+
+    ``postings`` need not be sorted; the top N by score are selected here.
+    """
+    top = heapq.nlargest(DIGEST_TOP_N, postings, key=lambda p: p.score)
     lines = []
-    for i, p in enumerate(postings[:DIGEST_TOP_N], 1):
-        emoji = _tier_emoji(p.score)
+    for i, p in enumerate(top, 1):
+        emoji = p.tier_emoji or tier_emoji(p.score)
         lines.append(
             f"{i}. {emoji} *{p.company}* — {p.title}\n"
             f"    Score: *{p.score}* | {p.location or 'Remote/Unknown'} | "
@@ -169,11 +190,16 @@ async def notify_slack(
     channel_id: str = "C0AC2NEL32R",
     min_score: int = 40,
     total_scanned: int = 0,
+    client: httpx.AsyncClient | None = None,
 ) -> int:
     """Send notifications to Slack. Returns count of messages sent.
 
+    Reuses ``client`` when given (e.g. the pipeline's shared client);
+    otherwise a short-lived client is opened for this call.
+
     Strategy:
-    - Score 75+: Individual "Hot Lead" alert (immediate attention)
+    - Score 75+: Individual "Hot Lead" alert (immediate attention); when there
+      are more than 3, they are batched into as few messages as possible
     - Score 40-74: Included in daily digest (top 5 only)
     - Score <40: Silenced completely
     """
@@ -181,50 +207,69 @@ async def notify_slack(
         logger.warning("No Slack credentials configured, skipping notifications")
         return 0
 
-    qualifying = sorted(
-        (p for p in postings if p.score >= min_score),
-        key=lambda p: p.score,
-        reverse=True,
-    )
+    qualifying = [p for p in postings if p.score >= min_score]
     if not qualifying:
         logger.info("No postings above minimum score threshold (%d)", min_score)
         return 0
 
-    hot_leads = [p for p in qualifying if p.score >= HOT_LEAD_THRESHOLD]
+    # Only the (few) hot leads need full ordering; the digest picks its own top N
+    hot_leads = sorted(
+        (p for p in qualifying if p.score >= HOT_LEAD_THRESHOLD),
+        key=lambda p: p.score,
+        reverse=True,
+    )
     digest_leads = [p for p in qualifying if p.score < HOT_LEAD_THRESHOLD]
 
+    if len(hot_leads) > HOT_LEAD_BATCH_THRESHOLD:
+        per_message = SLACK_MAX_BLOCKS // len(format_hot_lead(hot_leads[0])["blocks"])
+        hot_batches = [
+            hot_leads[i : i + per_message] for i in range(0, len(hot_leads), per_message)
+        ]
+    else:
+        hot_batches = [[p] for p in hot_leads]
+
+    hot_payloads = [
+        format_hot_lead(batch[0]) if len(batch) == 1 else format_hot_lead_batch(batch)
+        for batch in hot_batches
+    ]
+
+    async def _post(client: httpx.AsyncClient, payload: dict) -> bool:
+        return await _post_to_slack(client, payload, bot_token, channel_id, webhook_url)
+
+    async def _post_hot_leads(client: httpx.AsyncClient) -> list[bool]:
+        # One at a time, so the alerts land in Slack highest score first
+        return [await _post(client, payload) for payload in hot_payloads]
+
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(httpx.AsyncClient())
+        # The digest is independent of the alerts, so it goes out alongside them
+        digest = (
+            _post(client, format_digest(digest_leads, total_found=total_scanned or len(postings)))
+            if digest_leads
+            else asyncio.sleep(0, result=False)
+        )
+        results, digest_ok = await asyncio.gather(_post_hot_leads(client), digest)
+
     sent = 0
-    async with httpx.AsyncClient() as client:
-        # Send individual alerts for hot leads
-        for posting in hot_leads:
-            payload = format_hot_lead(posting)
-            ok = await _post_to_slack(
-                client, payload, bot_token, channel_id, webhook_url
-            )
-            if ok:
-                sent += 1
-                logger.info(
-                    "🔥 Hot lead: %s at %s (score: %d)",
-                    posting.title,
-                    posting.company,
-                    posting.score,
-                )
-
-        # Send a single digest for everything else
-        if digest_leads:
-            payload = format_digest(
-                digest_leads,
-                total_found=total_scanned or len(postings),
+    for batch, ok in zip(hot_batches, results):
+        if not ok:
+            continue
+        sent += 1
+        for posting in batch:
+            logger.info(
+                "🔥 Hot lead: %s at %s (score: %d)",
+                posting.title,
+                posting.company,
+                posting.score,
             )
-            ok = await _post_to_slack(
-                client, payload, bot_token, channel_id, webhook_url
-            )
-            if ok:
-                sent += 1
-                logger.info(
-                    "📊 Digest sent: top %d of %d qualifying leads",
-                    min(len(digest_leads), DIGEST_TOP_N),
-                    len(digest_leads),
-                )
+
+    if digest_ok:
+        sent += 1
+        logger.info(
+            "📊 Digest sent: top %d of %d qualifying leads",
+            min(len(digest_leads), DIGEST_TOP_N),
+            len(digest_leads),
+        )
 
     return sent
@@ -15,22 +15,25 @@ from datetime import UTC, datetime
 from .models import JobPosting
 
 # ── Title scoring (0-40) ──────────────────────────────────────────────
+# Optional pieces use possessive quantifiers / atomic groups (Python 3.11+):
+# they can never need to give text back, so this stops the engine retrying
+# them when the rest of the pattern fails.
 # Exact C-level titles score highest — that's the fractional play
 TITLE_PATTERNS: list[tuple[str, int]] = [
     (r"\bchief product officer\b", 50),
     (r"\bcpto\b", 50),
-    (r"\bchief product (?:&|and) technology officer\b", 48),
-    (r"\bsvp[,.]? (?:of )?product\b", 28),
-    (r"\bvp[,.]? (?:of )?product\b", 25),
-    (r"\bvice president[,.]? (?:of )?product\b", 25),
+    (r"\bchief product (?>&|and) technology officer\b", 48),
+    (r"\bsvp[,.]?+ (?:of )?+product\b", 28),
+    (r"\bvp[,.]?+ (?:of )?+product\b", 25),
+    (r"\bvice president[,.]?+ (?:of )?+product\b", 25),
     (r"\bhead of product\b", 22),
     (r"\bproduct leader\b", 15),
-    (r"\bdirector[,.]? (?:of )?product\b", 8),
+    (r"\bdirector[,.]?+ (?:of )?+product\b", 8),
 ]
 
 # ── Company quality signals ──────────────────────────────────────────
 # These are NEGATIVE signals — big corps and recruiters are not clients
-FORTUNE_500_KEYWORDS = {
+FORTUNE_500_KEYWORDS = frozenset({
     "jpmorgan", "jpmorganchase", "jp morgan", "goldman sachs", "bank of america",
     "wells fargo", "citigroup", "citi", "morgan stanley", "u.s. bank", "us bank",
     "capital one", "american express", "amex", "visa", "mastercard",
@@ -49,17 +52,17 @@ FORTUNE_500_KEYWORDS = {
     "bny", "state street", "fidelity", "vanguard", "blackrock",
     "trane technologies", "honeywell", "3m", "ge", "general electric",
     "sharkninja", "teradata", "hyland",
-}
+})
 
 # Staffing / recruiting firms — they're posting on behalf of others
-RECRUITER_KEYWORDS = {
+RECRUITER_KEYWORDS = frozenset({
     "lensa", "talently", "talener", "heidrick", "korn ferry", "spencer stuart",
     "robert half", "randstad", "adecco", "manpower", "kelly services",
     "hays", "michael page", "page group", "coda search", "staffing",
     "recruiting", "talent acquisition", "executive search", "search firm",
     "daley and associates", "christian & timbers", "brydon group",
     "selby jennings", "nxt level", "droisys",
-}
+})
 
 # Positive company signals — these are the target
 STARTUP_SIGNALS: list[tuple[str, int]] = [
@@ -69,8 +72,8 @@ STARTUP_SIGNALS: list[tuple[str, int]] = [
     (r"\bearly[- ]stage\b", 12),
     (r"\bgrowth[- ]stage\b", 8),
     (r"\bscale[- ]up\b", 8),
-    (r"\bfirst (?:product |)hire\b", 15),
-    (r"\bbuild(?:ing)? (?:the |a )?product (?:team|org|function)\b", 12),
+    (r"\bfirst (?:product )?+hire\b", 15),
+    (r"\bbuild(?:ing)?+ (?:the |a )?+product (?>team|org|function)\b", 12),
     (r"\bfractional\b", 15),
     (r"\binterim\b", 10),
     (r"\bcontract\b", 5),
@@ -86,6 +89,18 @@ STARTUP_SIGNALS: list[tuple[str, int]] = [
     (r"\bmarketplace\b", 3),
 ]
 
+# Freshness points indexed by age in days (0-30); anything older scores 0
+_FRESHNESS_BY_AGE = bytes(
+    [15] * 2  # today / yesterday
+    + [12] * 2  # <= 3 days
+    + [8] * 4  # <= 1 week
+    + [4] * 7  # <= 2 weeks
+    + [2] * 16  # <= 1 month
+)
+
+# Signals show up early in a posting; text past this many characters is not scanned
+DESCRIPTION_SCAN_LIMIT = 4096
+
 # Remote-friendly signals
 REMOTE_SIGNALS: list[tuple[str, int]] = [
     (r"\bremote\b", 8),
@@ -95,14 +110,89 @@ REMOTE_SIGNALS: list[tuple[str, int]] = [
 ]
 
 
+# The literal text a pattern must open with: after its leading \b, up to the first
+# regex syntax. A character that a quantifier then makes optional is not required.
+_REQUIRED_PREFIX_RE = re.compile(r"\\b([a-z0-9 &]*)([?*{]?)")
+
+_PatternTable = list[tuple[str, re.Pattern[str], int]]
+
+
+def _required_prefix(pattern: str) -> str:
+    match = _REQUIRED_PREFIX_RE.match(pattern)
+    if not match:
+        return ""
+    literal, quantifier = match.groups()
+    return literal[:-1] if quantifier else literal
+
+
+def _compile_table(patterns: list[tuple[str, int]]) -> _PatternTable:
+    """Precompile a weighted pattern table for matching against lowercased text.
+
+    Each pattern is searched on its own, so a search stops at its first match.
+    Each entry also keeps the literal text its pattern must contain. Callers
+    test for it with ``in`` first, which is far cheaper than a regex search.
+    The regex, which still checks the word boundaries, runs only when the
+    literal is present.
+    """
+    return [
+        (_required_prefix(pattern), re.compile(pattern), weight) for pattern, weight in patterns
+    ]
+
+
+def _sum_weights(table: _PatternTable, text: str, extra: str = "") -> int:
+    """Total weight of the patterns matching ``text`` or ``extra`` (both lowercased)."""
+    return sum(
+        weight
+        for literal, regex, weight in table
+        if (literal in text and regex.search(text))
+        or (extra and literal in extra and regex.search(extra))
+    )
+
+
+# Splits a lowercased company name into the tokens single-word keywords are matched against
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9&]+")
+
+
+def _compile_keywords(keywords: frozenset[str]) -> tuple[frozenset[str], re.Pattern[str]]:
+    """Split a keyword set into single-token keywords and a phrase matcher.
+
+    Single-token keywords ("google", "at&t") are checked with one set
+    intersection against the company's tokens; multi-word or punctuated
+    phrases ("bank of america", "coca-cola") are found with one substring scan.
+    """
+    tokens = frozenset(kw for kw in keywords if not _TOKEN_SPLIT_RE.search(kw))
+    # Longest first so overlapping phrases resolve to the most specific one
+    phrases = sorted(keywords - tokens, key=len, reverse=True)
+    return tokens, re.compile("|".join(re.escape(kw) for kw in phrases) or "(?!)")
+
+
+_FORTUNE_500_TOKENS, _FORTUNE_500_PHRASE_RE = _compile_keywords(FORTUNE_500_KEYWORDS)
+_RECRUITER_TOKENS, _RECRUITER_PHRASE_RE = _compile_keywords(RECRUITER_KEYWORDS)
+
+# Heaviest first, so the first title pattern that matches is the best one
+_TITLE_TABLE = _compile_table(sorted(TITLE_PATTERNS, key=lambda p: -p[1]))
+_STARTUP_TABLE = _compile_table(STARTUP_SIGNALS)
+_REMOTE_TABLE = _compile_table(REMOTE_SIGNALS)
+
+
+def _company_penalty(company_lower: str) -> int:
+    """-30 for Fortune 500 / big public companies, -20 for recruiters, else 0."""
+    tokens = set(_TOKEN_SPLIT_RE.split(company_lower))
+
+    if tokens & _FORTUNE_500_TOKENS or _FORTUNE_500_PHRASE_RE.search(company_lower):
+        return -30
+    if tokens & _RECRUITER_TOKENS or _RECRUITER_PHRASE_RE.search(company_lower):
+        return -20
+    return 0
+
+
 def score_title(title: str) -> int:
-    """Score based on job title match. Returns 0-40."""
+    """Score based on job title match. Returns 0-50."""
     title_lower = title.lower()
-    best = 0
-    for pattern, weight in TITLE_PATTERNS:
-        if re.search(pattern, title_lower):
-            best = max(best, weight)
-    return best
+    for literal, regex, weight in _TITLE_TABLE:
+        if literal in title_lower and regex.search(title_lower):
+            return weight
+    return 0
 
 
 def score_company(company: str, title: str, description: str) -> int:
@@ -111,64 +201,42 @@ def score_company(company: str, title: str, description: str) -> int:
     Negative = big corp or recruiter (penalize hard)
     Positive = startup signals
     """
-    combined = f"{company} {title} {description}".lower()
-    company_lower = company.lower().strip()
-
-    # Hard penalty: Fortune 500 / big public companies
-    for kw in FORTUNE_500_KEYWORDS:
-        if kw in company_lower:
-            return -30
-
-    # Hard penalty: Recruiting/staffing firms
-    for kw in RECRUITER_KEYWORDS:
-        if kw in company_lower:
-            return -20
+    penalty = _company_penalty(company.lower())
+    if penalty:
+        return penalty
 
     # Positive: startup/growth signals in description
-    total = 0
-    for pattern, weight in STARTUP_SIGNALS:
-        if re.search(pattern, combined):
-            total += weight
-
-    return min(total, 25)
+    text = f"{company} {title} {description[:DESCRIPTION_SCAN_LIMIT]}".lower()
+    return min(_sum_weights(_STARTUP_TABLE, text), 25)
 
 
 def score_remote(text: str) -> int:
     """Score remote-friendliness. Returns 0-10."""
-    text_lower = text.lower()
-    total = 0
-    for pattern, weight in REMOTE_SIGNALS:
-        if re.search(pattern, text_lower):
-            total += weight
-    return min(total, 10)
+    return min(_sum_weights(_REMOTE_TABLE, text.lower()), 10)
+
 
+def score_freshness(posted_date: datetime | None, now: datetime | None = None) -> int:
+    """Score based on how recent the posting is. Returns 0-15.
 
-def score_freshness(posted_date: datetime | None) -> int:
-    """Score based on how recent the posting is. Returns 0-15."""
+    ``now`` defaults to the current UTC time; batch callers pass one value in.
+    """
     if not posted_date:
         return 5  # Unknown date gets a moderate default
 
-    now = datetime.now(UTC)
+    if now is None:
+        now = datetime.now(UTC)
     if posted_date.tzinfo is None:
         posted_date = posted_date.replace(tzinfo=UTC)
 
     age_days = (now - posted_date).days
-
-    if age_days <= 1:
-        return 15
-    elif age_days <= 3:
-        return 12
-    elif age_days <= 7:
-        return 8
-    elif age_days <= 14:
-        return 4
-    elif age_days <= 30:
-        return 2
-    else:
+    if age_days < 0:
+        return _FRESHNESS_BY_AGE[0]  # Future-dated (clock skew) counts as today
+    if age_days >= len(_FRESHNESS_BY_AGE):
         return 0
+    return _FRESHNESS_BY_AGE[age_days]
 
 
-def score_posting(posting: JobPosting) -> int:
+def score_posting(posting: JobPosting, now: datetime | None = None) -> int:
     """Score a job posting on a 0-100 scale.
 
     Breakdown:
@@ -182,13 +250,30 @@ def score_posting(posting: JobPosting) -> int:
     A fresh CPO posting at a startup = 80+ (hot lead)
     A VP posting at JPMorgan = ~10 (noise)
     """
-    combined_text = f"{posting.title} {posting.location} {posting.description}"
+    # Scores like score_company() + score_remote(), but each field is lowercased
+    # once and title + description are joined once. Company and location are
+    # matched on their own, so a signal spanning two fields (a title ending in
+    # "work", a location starting "from anywhere") no longer counts.
+    body = f"{posting.title} {posting.description[:DESCRIPTION_SCAN_LIMIT]}".lower()
+    company_lower = posting.company.lower()
 
     title_score = score_title(posting.title)
-    company_score = score_company(posting.company, posting.title, posting.description)
-    remote_score = score_remote(combined_text)
-    freshness_score = score_freshness(posting.posted_date)
+    company_score = _company_penalty(company_lower)
+    if not company_score:
+        company_score = min(_sum_weights(_STARTUP_TABLE, body, company_lower), 25)
+    remote_score = min(_sum_weights(_REMOTE_TABLE, body, posting.location.lower()), 10)
+    freshness_score = score_freshness(posting.posted_date, now)
     base_score = 5
 
     total = title_score + company_score + remote_score + freshness_score + base_score
     return max(0, min(total, 100))
+
+
+def score_postings(postings: list[JobPosting], now: datetime | None = None) -> list[int]:
+    """Score a batch of postings (picklable entry point for worker processes).
+
+    The clock is read once for the whole batch unless ``now`` is given.
+    """
+    if now is None:
+        now = datetime.now(UTC)
+    return [score_posting(p, now) for p in postings]
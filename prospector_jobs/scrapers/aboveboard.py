@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 
 import httpx
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from ..models import JobPosting
@@ -19,6 +20,13 @@ logger = logging.getLogger(__name__)
 
 SEARCH_URL = "https://trueplatform.com/search/"
 
+# CSS selectors, compiled once rather than re-parsed for every card
+_CARD_SEL = sv.compile("div.job-card, article.job-listing, div[data-job-id]")
+_TITLE_SEL = sv.compile("h3, h2, a.job-title")
+_COMPANY_SEL = sv.compile("span.company-name, div.company")
+_LOCATION_SEL = sv.compile("span.location, div.location")
+_LINK_SEL = sv.compile("a[href]")
+
 
 class AboveboardScraper(BaseScraper):
     """Scrape AboveBoard/TruePlatform for executive product roles."""
@@ -26,7 +34,7 @@ class AboveboardScraper(BaseScraper):
     name = "aboveboard"
 
     async def scrape(self) -> list[JobPosting]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             try:
                 resp = await self._get(client, SEARCH_URL)
                 return self._parse_results(resp.text)
@@ -45,14 +53,17 @@ class AboveboardScraper(BaseScraper):
 
     def _parse_results(self, html: str) -> list[JobPosting]:
         """Parse AboveBoard/TruePlatform job listing page."""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_tree(BeautifulSoup(html, "lxml"))
+
+    def _parse_tree(self, soup: BeautifulSoup) -> list[JobPosting]:
+        """Extract postings from an already-parsed page."""
         postings: list[JobPosting] = []
 
-        for card in soup.select("div.job-card, article.job-listing, div[data-job-id]"):
-            title_el = card.select_one("h3, h2, a.job-title")
-            company_el = card.select_one("span.company-name, div.company")
-            location_el = card.select_one("span.location, div.location")
-            link_el = card.select_one("a[href]")
+        for card in _CARD_SEL.select(soup):
+            title_el = _TITLE_SEL.select_one(card)
+            company_el = _COMPANY_SEL.select_one(card)
+            location_el = _LOCATION_SEL.select_one(card)
+            link_el = _LINK_SEL.select_one(card)
 
             if not title_el:
                 continue
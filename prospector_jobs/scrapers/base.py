@@ -6,6 +6,8 @@ import asyncio
 import logging
 import random
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 
 import httpx
 
@@ -13,14 +15,42 @@ from ..models import JobPosting
 
 logger = logging.getLogger(__name__)
 
+# Requests a single scraper may have in flight at once (per-host politeness cap)
+MAX_CONCURRENT_REQUESTS = 3
+
+# Extra random wait per request, as a fraction of the scraper's delay
+JITTER_FRACTION = 0.2
+
+
+class RateLimiter:
+    """Space request start times at least ``interval`` seconds apart.
+
+    Unlike sleeping a full delay before every request, callers only wait for
+    their reserved slot, so one request's network time overlaps the next one's wait.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class BaseScraper(ABC):
     """Base scraper with shared HTTP client management and rate limiting."""
 
     name: str = "base"
 
-    def __init__(self, delay: float = 2.0):
+    def __init__(self, delay: float = 2.0, client: httpx.AsyncClient | None = None):
         self.delay = delay
+        self.client = client
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._limiter = RateLimiter(delay)
         self._headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -31,16 +61,47 @@ class BaseScraper(ABC):
             "Accept-Language": "en-US,en;q=0.9",
         }
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the injected shared client, or a short-lived one if none was given."""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                yield client
+
     async def _get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
-        """Make a GET request with rate limiting and jitter."""
-        jitter = random.uniform(0.5, 1.5)  # noqa: S311
-        await asyncio.sleep(self.delay * jitter)
+        """Make a GET request with rate limiting and jitter.
+
+        Requests from one scraper start at least ``delay`` seconds apart (plus a
+        little jitter), with at most ``MAX_CONCURRENT_REQUESTS`` in flight.
+        """
+        async with self._semaphore:
+            await self._limiter.wait()
+            jitter = random.uniform(0, JITTER_FRACTION)  # noqa: S311
+            await asyncio.sleep(self.delay * jitter)
 
-        logger.debug("[%s] GET %s", self.name, url)
-        resp = await client.get(url, headers=self._headers, follow_redirects=True, **kwargs)
+            logger.debug("[%s] GET %s", self.name, url)
+            resp = await client.get(url, headers=self._headers, follow_redirects=True, **kwargs)
         resp.raise_for_status()
         return resp
 
+    @staticmethod
+    def _merge_unique(batches: Iterable[list[JobPosting]]) -> list[JobPosting]:
+        """Flatten per-search result batches, keeping the first posting per dedup key.
+
+        Overlapping search terms return many of the same jobs; dropping them here
+        keeps repeats out of scoring and the pipeline-wide dedup.
+        """
+        seen: set[str] = set()
+        postings: list[JobPosting] = []
+        for batch in batches:
+            for posting in batch:
+                if posting.dedup_key not in seen:
+                    seen.add(posting.dedup_key)
+                    postings.append(posting)
+        return postings
+
     @abstractmethod
     async def scrape(self) -> list[JobPosting]:
         """Scrape job postings from this source. Must be implemented by subclasses."""
@@ -7,10 +7,12 @@ Without those, it will log a warning and return empty results.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from urllib.parse import quote_plus
 
 import httpx
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from ..models import JobPosting
@@ -25,6 +27,13 @@ SEARCH_TERMS = [
     "Head of Product",
 ]
 
+# CSS selectors, compiled once rather than re-parsed for every card
+_CARD_SEL = sv.compile("div.job_seen_beacon, div.jobsearch-ResultsList > div")
+_TITLE_SEL = sv.compile("h2.jobTitle a, a.jcs-JobTitle")
+_COMPANY_SEL = sv.compile("span[data-testid='company-name'], span.companyName")
+_LOCATION_SEL = sv.compile("div[data-testid='text-location'], div.companyLocation")
+_SNIPPET_SEL = sv.compile("div.job-snippet, td.snip")
+
 
 class IndeedScraper(BaseScraper):
     """Scrape Indeed for product leadership roles."""
@@ -32,14 +41,11 @@ class IndeedScraper(BaseScraper):
     name = "indeed"
 
     async def scrape(self) -> list[JobPosting]:
-        postings: list[JobPosting] = []
+        # Searches are independent; _get caps how many hit the host at once
+        async with self._session() as client:
+            results = await asyncio.gather(*(self._search(client, term) for term in SEARCH_TERMS))
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for term in SEARCH_TERMS:
-                results = await self._search(client, term)
-                postings.extend(results)
-
-        return postings
+        return self._merge_unique(results)
 
     async def _search(self, client: httpx.AsyncClient, term: str) -> list[JobPosting]:
         """Search Indeed for a specific term."""
@@ -61,14 +67,17 @@ class IndeedScraper(BaseScraper):
 
     def _parse_results(self, html: str) -> list[JobPosting]:
         """Parse Indeed search results page."""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_tree(BeautifulSoup(html, "lxml"))
+
+    def _parse_tree(self, soup: BeautifulSoup) -> list[JobPosting]:
+        """Extract postings from an already-parsed page."""
         postings: list[JobPosting] = []
 
-        for card in soup.select("div.job_seen_beacon, div.jobsearch-ResultsList > div"):
-            title_el = card.select_one("h2.jobTitle a, a.jcs-JobTitle")
-            company_el = card.select_one("span[data-testid='company-name'], span.companyName")
-            location_el = card.select_one("div[data-testid='text-location'], div.companyLocation")
-            snippet_el = card.select_one("div.job-snippet, td.snip")
+        for card in _CARD_SEL.select(soup):
+            title_el = _TITLE_SEL.select_one(card)
+            company_el = _COMPANY_SEL.select_one(card)
+            location_el = _LOCATION_SEL.select_one(card)
+            snippet_el = _SNIPPET_SEL.select_one(card)
 
             if not title_el:
                 continue
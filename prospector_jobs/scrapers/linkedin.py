@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from datetime import datetime, timezone
-from urllib.parse import quote_plus, urlencode
+from dataclasses import replace
+from datetime import UTC, datetime
+from functools import lru_cache
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from ..models import JobPosting
@@ -26,14 +31,91 @@ SEARCH_QUERIES = [
 # LinkedIn public search base URL
 BASE_URL = "https://www.linkedin.com/jobs/search/"
 
+# CSS selectors, compiled once rather than re-parsed for every card
+_CARD_SEL = sv.compile("div.base-card")
+_TITLE_SEL = sv.compile("h3.base-search-card__title, h3")
+_COMPANY_SEL = sv.compile("h4.base-search-card__subtitle, h4 a")
+_LOCATION_SEL = sv.compile("span.job-search-card__location")
+_LINK_SEL = sv.compile("a.base-card__full-link, a[href*='/jobs/']")
+_TIME_SEL = sv.compile("time")
+
+# Structured-data blocks; JobPosting JSON-LD carries cleaner fields than the cards
+_LD_JSON_RE = re.compile(
+    r"<script[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Opening tags of the result cards _CARD_SEL matches, counted on the raw page so the
+# DOM is only built when the JSON-LD does not already describe every card
+_CARD_TAG_RE = re.compile(r"""<div\b[^>]*\bclass=["'](?:[^"']*\s)?base-card[\s"']""")
+
+# Title-cleanup patterns, compiled once for the per-result helpers below
+_COMPANY_RES = (
+    re.compile(r"(?:at|@)\s+(.+?)(?:\s*[-|]|$)", re.IGNORECASE),
+    re.compile(r"[-|]\s*(.+?)\s*[-|]\s*LinkedIn", re.IGNORECASE),
+)
+_COMPANY_SUFFIX_RE = re.compile(r"\s*[-|]\s*LinkedIn.*$", re.IGNORECASE)
+_TITLE_SUFFIX_RE = re.compile(r"\s*[-|].*LinkedIn.*$", re.IGNORECASE)
+_TRAILING_SEPARATOR_RE = re.compile(r"\s*[-|]\s*$")
+
+
+def _parse_date(value: str) -> datetime | None:
+    """Parse a leading YYYY-MM-DD date as UTC midnight, or None if malformed."""
+    # Fixed format: slicing avoids strptime's locale/regex machinery
+    try:
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]), tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def _ld_str(value: object) -> str:
+    """``value`` if it is a string, else "" (JSON-LD fields are not type-checked upstream)."""
+    return value if isinstance(value, str) else ""
+
+
+def _ld_location(item: dict) -> str:
+    """Human-readable location from a JobPosting JSON-LD item."""
+    if item.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    place = item.get("jobLocation")
+    if isinstance(place, list):
+        place = place[0] if place else None
+    address = place.get("address") if isinstance(place, dict) else None
+    if not isinstance(address, dict):
+        return ""
+    parts = (address.get("addressLocality"), address.get("addressRegion"))
+    return ", ".join(p for p in parts if isinstance(p, str) and p)
+
+
+# Result titles repeat across overlapping searches and pages; both helpers are pure
+@lru_cache(maxsize=4096)
+def _extract_company(title: str) -> str:
+    for pattern in _COMPANY_RES:
+        match = pattern.search(title)
+        if match:
+            return _COMPANY_SUFFIX_RE.sub("", match.group(1).strip())
+    return "Unknown"
+
+
+@lru_cache(maxsize=4096)
+def _clean_title(title: str) -> str:
+    title = _TITLE_SUFFIX_RE.sub("", title)
+    title = _TRAILING_SEPARATOR_RE.sub("", title)
+    return title.strip()
+
 
 class LinkedInScraper(BaseScraper):
     """Scrape LinkedIn's public job search (no API key needed)."""
 
     name = "linkedin"
 
-    def __init__(self, serpapi_key: str = "", delay: float = 3.0):
-        super().__init__(delay=delay)
+    def __init__(
+        self,
+        serpapi_key: str = "",
+        delay: float = 3.0,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(delay=delay, client=client)
         self.serpapi_key = serpapi_key
         # LinkedIn needs these specific headers
         self._headers.update(
@@ -52,14 +134,13 @@ class LinkedInScraper(BaseScraper):
 
     async def scrape(self) -> list[JobPosting]:
         """Run all search queries and collect results."""
-        postings: list[JobPosting] = []
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for query in SEARCH_QUERIES:
-                results = await self._search(client, query)
-                postings.extend(results)
+        # Searches are independent; _get caps how many hit the host at once
+        async with self._session() as client:
+            results = await asyncio.gather(
+                *(self._search(client, query) for query in SEARCH_QUERIES)
+            )
 
-        return postings
+        return self._merge_unique(results)
 
     async def _search(self, client: httpx.AsyncClient, query: str) -> list[JobPosting]:
         """Search LinkedIn public jobs for a query."""
@@ -83,15 +164,87 @@ class LinkedInScraper(BaseScraper):
 
     def _parse_results(self, html: str) -> list[JobPosting]:
         """Parse LinkedIn public job search results."""
-        soup = BeautifulSoup(html, "html.parser")
+        ld_postings = self._parse_ld_json(html)
+        if ld_postings and self._ld_covers_page(ld_postings, html):
+            return ld_postings
+        cards = self._parse_tree(BeautifulSoup(html, "lxml"))
+        return self._merge_cards(ld_postings, cards) if ld_postings else cards
+
+    @staticmethod
+    def _ld_covers_page(ld_postings: list[JobPosting], html: str) -> bool:
+        """True if the JSON-LD stands alone: complete, and at least one item per card."""
+        if not all(p.url and p.company != "Unknown" for p in ld_postings):
+            return False
+        return len(ld_postings) >= len(_CARD_TAG_RE.findall(html))
+
+    @staticmethod
+    def _merge_cards(ld_postings: list[JobPosting], cards: list[JobPosting]) -> list[JobPosting]:
+        """Combine JSON-LD postings with the page's cards, matching them by URL.
+
+        A JSON-LD posting's blank fields are filled from the card with its URL;
+        cards no JSON-LD item describes are kept as they are.
+        """
+        unmatched = {card.url: card for card in cards if card.url}
+        merged: list[JobPosting] = []
+        for posting in ld_postings:
+            card = unmatched.pop(posting.url, None) if posting.url else None
+            if card:
+                # replace() rebuilds the posting, so its dedup key follows the new company
+                posting = replace(
+                    posting,
+                    company=card.company if posting.company == "Unknown" else posting.company,
+                    location=posting.location or card.location,
+                    posted_date=posting.posted_date or card.posted_date,
+                )
+            merged.append(posting)
+        merged.extend(card for card in cards if not card.url or card.url in unmatched)
+        return merged
+
+    def _parse_ld_json(self, html: str) -> list[JobPosting]:
+        """Read postings from embedded JobPosting JSON-LD blocks."""
+        postings: list[JobPosting] = []
+
+        for block in _LD_JSON_RE.findall(html):
+            try:
+                data = orjson.loads(block)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                data = data.get("@graph", [data])
+            if not isinstance(data, list):
+                continue
+
+            for item in data:
+                if not isinstance(item, dict) or item.get("@type") != "JobPosting":
+                    continue
+                title = item.get("title")
+                if not isinstance(title, str) or not title:
+                    continue
+                org = item.get("hiringOrganization")
+                company = _ld_str(org.get("name")) if isinstance(org, dict) else ""
+                postings.append(
+                    JobPosting(
+                        title=title,
+                        company=company or "Unknown",
+                        url=_ld_str(item.get("url")).split("?")[0],
+                        source="linkedin",
+                        location=_ld_location(item),
+                        posted_date=_parse_date(_ld_str(item.get("datePosted"))),
+                    )
+                )
+
+        return postings
+
+    def _parse_tree(self, soup: BeautifulSoup) -> list[JobPosting]:
+        """Extract postings from the search result cards of an already-parsed page."""
         postings: list[JobPosting] = []
 
-        for card in soup.select("div.base-card"):
-            title_el = card.select_one("h3.base-search-card__title, h3")
-            company_el = card.select_one("h4.base-search-card__subtitle, h4 a")
-            location_el = card.select_one("span.job-search-card__location")
-            link_el = card.select_one("a.base-card__full-link, a[href*='/jobs/']")
-            time_el = card.select_one("time")
+        for card in _CARD_SEL.select(soup):
+            title_el = _TITLE_SEL.select_one(card)
+            company_el = _COMPANY_SEL.select_one(card)
+            location_el = _LOCATION_SEL.select_one(card)
+            link_el = _LINK_SEL.select_one(card)
+            time_el = _TIME_SEL.select_one(card)
 
             if not title_el:
                 continue
@@ -109,13 +262,8 @@ class LinkedInScraper(BaseScraper):
             posted_date = None
             if time_el:
                 dt_str = time_el.get("datetime", "")
-                if dt_str:
-                    try:
-                        posted_date = datetime.strptime(dt_str, "%Y-%m-%d").replace(
-                            tzinfo=timezone.utc
-                        )
-                    except ValueError:
-                        pass
+                if isinstance(dt_str, str):
+                    posted_date = _parse_date(dt_str)
 
             postings.append(
                 JobPosting(
@@ -134,21 +282,9 @@ class LinkedInScraper(BaseScraper):
     @staticmethod
     def _extract_company(title: str) -> str:
         """Extract company name from 'Role at Company - LinkedIn' patterns."""
-        patterns = [
-            r"(?:at|@)\s+(.+?)(?:\s*[-|]|$)",
-            r"[-|]\s*(.+?)\s*[-|]\s*LinkedIn",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                company = re.sub(r"\s*[-|]\s*LinkedIn.*$", "", company, flags=re.IGNORECASE)
-                return company
-        return "Unknown"
+        return _extract_company(title)
 
     @staticmethod
     def _clean_title(title: str) -> str:
         """Clean up a job title extracted from search results."""
-        title = re.sub(r"\s*[-|].*LinkedIn.*$", "", title, flags=re.IGNORECASE)
-        title = re.sub(r"\s*[-|]\s*$", "", title)
-        return title.strip()
+        return _clean_title(title)
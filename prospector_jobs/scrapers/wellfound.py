@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import re
 
 import httpx
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from ..models import JobPosting
@@ -14,6 +16,30 @@ logger = logging.getLogger(__name__)
 
 SEARCH_URL = "https://wellfound.com/role/product-manager"
 
+# Only senior product roles are kept (case-insensitive substring match)
+SENIOR_TITLE_KEYWORDS = [
+    "chief product",
+    "cpto",
+    "vp product",
+    "vp of product",
+    "head of product",
+    "product leader",
+    "svp product",
+    "director product",
+]
+_SENIOR_TITLE_RE = re.compile(
+    "|".join(re.escape(kw) for kw in SENIOR_TITLE_KEYWORDS), re.IGNORECASE
+)
+
+# CSS selectors, compiled once rather than re-parsed for every card
+_CARD_SEL = sv.compile(
+    "div.styles_jobListing__title, div[data-test='StartupResult'], div.job-listing"
+)
+_TITLE_SEL = sv.compile("a.job-title, h4, a[href*='/jobs/']")
+_COMPANY_SEL = sv.compile("a.company-name, h2, a[href*='/company/']")
+_LOCATION_SEL = sv.compile("span.location, div.text-neutral-400")
+_LINK_SEL = sv.compile("a[href*='/jobs/']")
+
 
 class WellfoundScraper(BaseScraper):
     """Scrape Wellfound for startup product leadership roles."""
@@ -21,7 +47,7 @@ class WellfoundScraper(BaseScraper):
     name = "wellfound"
 
     async def scrape(self) -> list[JobPosting]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             try:
                 resp = await self._get(client, SEARCH_URL)
                 return self._parse_results(resp.text)
@@ -31,39 +57,27 @@ class WellfoundScraper(BaseScraper):
 
     def _parse_results(self, html: str) -> list[JobPosting]:
         """Parse Wellfound job listing page."""
-        soup = BeautifulSoup(html, "html.parser")
-        postings: list[JobPosting] = []
+        return self._parse_tree(BeautifulSoup(html, "lxml"))
 
-        for card in soup.select(
-            "div.styles_jobListing__title, div[data-test='StartupResult'], div.job-listing"
-        ):
-            title_el = card.select_one("a.job-title, h4, a[href*='/jobs/']")
-            company_el = card.select_one("a.company-name, h2, a[href*='/company/']")
-            location_el = card.select_one("span.location, div.text-neutral-400")
-            link_el = card.select_one("a[href*='/jobs/']")
+    def _parse_tree(self, soup: BeautifulSoup) -> list[JobPosting]:
+        """Extract postings from an already-parsed page."""
+        postings: list[JobPosting] = []
 
+        for card in _CARD_SEL.select(soup):
+            title_el = _TITLE_SEL.select_one(card)
             if not title_el:
                 continue
 
             title = title_el.get_text(strip=True)
 
-            # Filter for senior product roles only
-            title_lower = title.lower()
-            if not any(
-                kw in title_lower
-                for kw in [
-                    "chief product",
-                    "cpto",
-                    "vp product",
-                    "vp of product",
-                    "head of product",
-                    "product leader",
-                    "svp product",
-                    "director product",
-                ]
-            ):
+            # Filter for senior product roles only, before querying the rest of the card
+            if not _SENIOR_TITLE_RE.search(title):
                 continue
 
+            company_el = _COMPANY_SEL.select_one(card)
+            location_el = _LOCATION_SEL.select_one(card)
+            link_el = _LINK_SEL.select_one(card)
+
             href = ""
             if link_el:
                 raw_href = link_el.get("href", "")
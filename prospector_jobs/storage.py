@@ -1,56 +1,172 @@
-"""Persistent storage for job postings (JSON-based)."""
+"""Persistent storage for job postings (JSON Lines, one posting per line).
+
+Files written by older versions hold a single JSON array; they are still
+readable and are converted to JSON Lines the next time postings are added.
+
+Next to the data file, a ``.keys`` sidecar holds one JSON-encoded dedup key
+per line, so appending only has to read the keys, not every stored posting.
+"""
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from pathlib import Path
 
+import orjson
+
 from .models import JobPosting
 
 logger = logging.getLogger(__name__)
 
 
-def load_postings(path: Path) -> list[JobPosting]:
-    """Load existing postings from JSON file."""
+def _is_json_array(path: Path) -> bool:
+    """True if ``path`` holds a legacy single-array JSON document."""
+    with path.open("rb") as f:
+        return f.read(64).lstrip().startswith(b"[")
+
+
+def _missing_final_newline(path: Path) -> bool:
+    """True if ``path`` ends in an unterminated line (e.g. a write cut short by a crash)."""
+    with path.open("rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _append_lines(path: Path, lines: list[bytes]) -> None:
+    """Append newline-terminated ``lines``, never gluing the first onto a torn last line."""
+    prefix = b"\n" if path.exists() and _missing_final_newline(path) else b""
+    with path.open("ab") as f:
+        f.write(prefix + b"".join(lines))
+
+
+def _keys_path(path: Path) -> Path:
+    return path.with_suffix(".keys")
+
+
+def _write_keys(postings: list[JobPosting], path: Path, mode: str) -> None:
+    lines = [orjson.dumps(p.dedup_key) + b"\n" for p in postings]
+    if mode == "ab":
+        _append_lines(_keys_path(path), lines)
+    else:
+        _keys_path(path).write_bytes(b"".join(lines))
+
+
+def _load_keys(path: Path) -> set[str] | None:
+    """Dedup keys of everything stored at ``path``, rebuilding the sidecar if needed.
+
+    Returns None, without touching the sidecar, if the stored postings cannot be read.
+    """
     if not path.exists():
-        return []
+        # A sidecar left behind by a deleted data file describes postings that are gone
+        _keys_path(path).unlink(missing_ok=True)
+        return set()
+
+    keys_path = _keys_path(path)
+    if keys_path.exists():
+        try:
+            return {orjson.loads(line) for line in keys_path.read_bytes().splitlines() if line}
+        except orjson.JSONDecodeError as e:
+            logger.warning("Rebuilding unreadable %s: %s", keys_path, e)
+
+    existing = _read_postings(path)
+    if existing is None:
+        # An empty sidecar would make every stored posting look new
+        return None
+    _write_keys(existing, path, "wb")
+    return {p.dedup_key for p in existing}
 
+
+def _read_postings(path: Path) -> list[JobPosting] | None:
+    """Postings stored at ``path``, or None if the file cannot be read at all.
+
+    In a JSON Lines file, records that cannot be decoded (such as a last
+    line torn by a crash mid-append) are logged and skipped.
+    """
     try:
-        data = json.loads(path.read_text())
-        return [JobPosting.from_dict(d) for d in data]
-    except (json.JSONDecodeError, KeyError) as e:
+        raw = path.read_bytes()
+        if raw.lstrip().startswith(b"["):
+            records = orjson.loads(raw)
+        else:
+            records = []
+            for lineno, line in enumerate(raw.splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(orjson.loads(line))
+                except orjson.JSONDecodeError as e:
+                    logger.warning("Skipping unreadable line %d of %s: %s", lineno, path, e)
+    except (OSError, orjson.JSONDecodeError) as e:
         logger.error("Failed to load postings from %s: %s", path, e)
+        return None
+
+    postings: list[JobPosting] = []
+    for record in records:
+        try:
+            postings.append(JobPosting.from_dict(record))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Skipping malformed record in %s: %r", path, e)
+    return postings
+
+
+def load_postings(path: Path) -> list[JobPosting]:
+    """Load existing postings from storage."""
+    if not path.exists():
         return []
+    postings = _read_postings(path)
+    return postings if postings is not None else []
 
 
 def save_postings(postings: list[JobPosting], path: Path) -> None:
-    """Save postings to JSON file, creating directories as needed."""
+    """Rewrite storage with exactly ``postings``, creating directories as needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = [p.to_dict() for p in postings]
-    path.write_text(json.dumps(data, indent=2, default=str))
+    path.write_bytes(b"".join(p.to_json_bytes() + b"\n" for p in postings))
+    _write_keys(postings, path, "wb")
     logger.info("Saved %d postings to %s", len(postings), path)
 
 
-def append_postings(new_postings: list[JobPosting], path: Path) -> list[JobPosting]:
+def append_postings(new_postings: list[JobPosting], path: Path) -> int:
     """Append new postings to existing storage, avoiding duplicates.
 
-    Returns the full list of all postings.
+    Only the new records are written and only the dedup keys of existing
+    ones are read; stored postings are never re-parsed or re-serialized
+    (except once, when migrating a legacy JSON array file).
+
+    Returns the total number of stored postings, or 0 if the existing
+    storage cannot be read (nothing is written then).
     """
-    existing = load_postings(path)
-    existing_keys = {p.dedup_key for p in existing}
+    existing_keys = _load_keys(path)
+    if existing_keys is None:
+        logger.error(
+            "Not appending to unreadable %s; %d postings not stored", path, len(new_postings)
+        )
+        return 0
 
-    added = 0
+    added: list[JobPosting] = []
     for posting in new_postings:
         if posting.dedup_key not in existing_keys:
-            existing.append(posting)
+            added.append(posting)
             existing_keys.add(posting.dedup_key)
-            added += 1
 
-    if added > 0:
-        save_postings(existing, path)
-        logger.info("Added %d new postings (total: %d)", added, len(existing))
-    else:
+    if not added:
         logger.info("No new postings to add")
+        return len(existing_keys)
+
+    if path.exists() and _is_json_array(path):
+        existing = _read_postings(path)
+        if existing is None:
+            logger.error(
+                "Not migrating unreadable %s; %d new postings not stored", path, len(added)
+            )
+            return 0
+        logger.info("Migrating %s to JSON Lines", path)
+        save_postings(existing + added, path)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _append_lines(path, [p.to_json_bytes() + b"\n" for p in added])
+        _write_keys(added, path, "ab")
+    logger.info("Added %d new postings (total: %d)", len(added), len(existing_keys))
 
-    return existing
+    return len(existing_keys)
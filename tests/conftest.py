@@ -2,65 +2,149 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 
 from prospector_jobs.models import JobPosting
 
+# Built once at import; fixtures hand out shallow copies so tests may mutate them
+_NOW = datetime.now(UTC)
+
+_SAMPLE_CPO = JobPosting(
+    title="Chief Product Officer",
+    company="Acme Corp",
+    url="https://linkedin.com/jobs/123",
+    source="linkedin",
+    posted_date=_NOW,
+    location="Remote",
+    description="Join our Series B startup as our first CPO. Build the product org from scratch.",
+    score=0,
+)
+
+_SAMPLE_VP = JobPosting(
+    title="VP of Product",
+    company="TechStart Inc",
+    url="https://indeed.com/jobs/456",
+    source="indeed",
+    posted_date=_NOW,
+    location="San Francisco, CA",
+    description="Lead product strategy for our growth-stage SaaS platform.",
+    score=0,
+)
+
+_SAMPLE_HEAD = JobPosting(
+    title="Head of Product",
+    company="DataFlow",
+    url="https://wellfound.com/jobs/789",
+    source="wellfound",
+    location="New York, NY (Hybrid)",
+    description="Early-stage AI startup looking for a product leader.",
+    score=0,
+)
+
+_SAMPLE_DIRECTOR = JobPosting(
+    title="Director of Product Management",
+    company="BigCorp",
+    url="https://indeed.com/jobs/101",
+    source="indeed",
+    location="Chicago, IL",
+    description="Manage a team of 10 PMs in our enterprise division.",
+    score=0,
+)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when the ``[fast]`` extra is installed, like the CLI does."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """One reference time for the whole run, so freshness scores are deterministic."""
+    return _NOW
+
+
+class MockJobBoards:
+    """In-process stand-in for the job boards, served through ``httpx.MockTransport``.
+
+    Tests set a canned response per board; requests to any other host fail loudly.
+    """
+
+    HOSTS = {
+        "www.linkedin.com": "linkedin",
+        "www.indeed.com": "indeed",
+        "trueplatform.com": "aboveboard",
+        "wellfound.com": "wellfound",
+    }
+
+    def __init__(self) -> None:
+        self.responses: dict[str, tuple[int, str]] = {}
+        self.calls: dict[str, int] = {}
+
+    def respond(self, board: str, status_code: int, text: str) -> None:
+        self.responses[board] = (status_code, text)
+
+    def reset(self) -> None:
+        self.responses.clear()
+        self.calls.clear()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        board = self.HOSTS.get(request.url.host)
+        if board is None or board not in self.responses:
+            raise AssertionError(f"Unexpected request to {request.url}")
+        self.calls[board] = self.calls.get(board, 0) + 1
+        status_code, text = self.responses[board]
+        return httpx.Response(status_code, text=text)
+
+
+@pytest.fixture(scope="session")
+def _job_boards() -> MockJobBoards:
+    return MockJobBoards()
+
+
+@pytest.fixture(scope="session")
+def http_client(_job_boards) -> Iterator[httpx.AsyncClient]:
+    """One client for every scraper test, wired straight to the mock job boards."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_job_boards.handle))
+    yield client
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture
+def job_boards(_job_boards) -> Iterator[MockJobBoards]:
+    """Per-test view of the mock boards; responses and call counts are cleared afterwards."""
+    yield _job_boards
+    _job_boards.reset()
+
 
 @pytest.fixture
 def sample_cpo_posting() -> JobPosting:
-    return JobPosting(
-        title="Chief Product Officer",
-        company="Acme Corp",
-        url="https://linkedin.com/jobs/123",
-        source="linkedin",
-        posted_date=datetime.now(UTC),
-        location="Remote",
-        description="Join our Series B startup as our first CPO. Build the product org from scratch.",
-        score=0,
-    )
+    return copy.copy(_SAMPLE_CPO)
 
 
 @pytest.fixture
 def sample_vp_posting() -> JobPosting:
-    return JobPosting(
-        title="VP of Product",
-        company="TechStart Inc",
-        url="https://indeed.com/jobs/456",
-        source="indeed",
-        posted_date=datetime.now(UTC),
-        location="San Francisco, CA",
-        description="Lead product strategy for our growth-stage SaaS platform.",
-        score=0,
-    )
+    return copy.copy(_SAMPLE_VP)
 
 
 @pytest.fixture
 def sample_head_posting() -> JobPosting:
-    return JobPosting(
-        title="Head of Product",
-        company="DataFlow",
-        url="https://wellfound.com/jobs/789",
-        source="wellfound",
-        location="New York, NY (Hybrid)",
-        description="Early-stage AI startup looking for a product leader.",
-        score=0,
-    )
+    return copy.copy(_SAMPLE_HEAD)
 
 
 @pytest.fixture
 def sample_director_posting() -> JobPosting:
-    return JobPosting(
-        title="Director of Product Management",
-        company="BigCorp",
-        url="https://indeed.com/jobs/101",
-        source="indeed",
-        location="Chicago, IL",
-        description="Manage a team of 10 PMs in our enterprise division.",
-        score=0,
-    )
+    return copy.copy(_SAMPLE_DIRECTOR)
 
 
 @pytest.fixture
@@ -70,7 +154,7 @@ def sample_postings(
     return [sample_cpo_posting, sample_vp_posting, sample_head_posting, sample_director_posting]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def google_search_html() -> str:
     """Mock Google search results HTML."""
     return """
@@ -97,7 +181,7 @@ def google_search_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def indeed_search_html() -> str:
     """Mock Indeed search results HTML."""
     return """
@@ -118,7 +202,7 @@ def indeed_search_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aboveboard_search_html() -> str:
     """Mock AboveBoard search results HTML."""
     return """
@@ -133,7 +217,7 @@ def aboveboard_search_html() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wellfound_search_html() -> str:
     """Mock Wellfound search results HTML."""
     return """
@@ -150,3 +234,19 @@ def wellfound_search_html() -> str:
     </div>
     </body></html>
     """
+
+
+# Parsed once per run; the parsers only read the tree, so tests can share it
+@pytest.fixture(scope="session")
+def indeed_tree(indeed_search_html) -> BeautifulSoup:
+    return BeautifulSoup(indeed_search_html, "lxml")
+
+
+@pytest.fixture(scope="session")
+def aboveboard_tree(aboveboard_search_html) -> BeautifulSoup:
+    return BeautifulSoup(aboveboard_search_html, "lxml")
+
+
+@pytest.fixture(scope="session")
+def wellfound_tree(wellfound_search_html) -> BeautifulSoup:
+    return BeautifulSoup(wellfound_search_html, "lxml")
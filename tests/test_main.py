@@ -0,0 +1,44 @@
+"""Tests for the pipeline's scoring and summary helpers."""
+
+from __future__ import annotations
+
+import copy
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pytest
+
+from prospector_jobs.main import PROCESS_POOL_MIN_POSTINGS, _score_all, _summary_emoji
+from prospector_jobs.notifier import tier_emoji
+from prospector_jobs.scorer import score_posting
+
+
+class _NoPool(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise AssertionError("small batches should be scored inline")
+
+
+class TestSummaryEmoji:
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [(100, "🔥"), (70, "🔥"), (69, "⭐"), (50, "⭐"), (49, "  "), (0, "  ")],
+    )
+    def test_thresholds(self, score, expected):
+        assert _summary_emoji(score) == expected
+
+
+class TestScoreAll:
+    async def test_small_batch_scored_inline(self, sample_postings, frozen_now):
+        await _score_all(sample_postings, frozen_now, _NoPool())
+        for posting in sample_postings:
+            assert posting.score == score_posting(posting, frozen_now)
+            assert posting.tier_emoji == tier_emoji(posting.score)
+
+    @pytest.mark.parametrize("extra", [0, 37])
+    async def test_large_batch_scored_in_pool(self, sample_postings, frozen_now, extra):
+        count = PROCESS_POOL_MIN_POSTINGS + extra
+        postings = [copy.copy(sample_postings[i % len(sample_postings)]) for i in range(count)]
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            await _score_all(postings, frozen_now, pool)
+        # Scores come back from the workers in input order
+        assert [p.score for p in postings] == [score_posting(p, frozen_now) for p in postings]
+        assert all(p.tier_emoji == tier_emoji(p.score) for p in postings)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import orjson
+
 from prospector_jobs.models import JobPosting
 
 
@@ -20,6 +22,25 @@ class TestJobPosting:
         p2 = JobPosting(title="cpo", company="acme", url="", source="b")
         assert p1.dedup_key == p2.dedup_key
 
+    def test_dedup_key_collapses_whitespace(self):
+        p1 = JobPosting(title="Chief  Product\nOfficer", company="Acme\tCorp", url="", source="a")
+        p2 = JobPosting(title="Chief Product Officer", company="Acme Corp", url="", source="b")
+        assert p1.dedup_key == p2.dedup_key
+
+    def test_dedup_key_interned(self):
+        p1 = JobPosting(title="CPO", company="Acme", url="", source="a")
+        p2 = JobPosting(title="cpo", company="ACME", url="", source="b")
+        assert p1.dedup_key is p2.dedup_key
+
+    def test_repeated_fields_interned(self):
+        p1 = JobPosting(title="CPO", company="Acme", url="", source="a", location="Remote")
+        p2 = JobPosting(title="VP", company="Acme", url="", source="a", location="".join("Remote"))
+        assert p1.location is p2.location
+        assert p1.company is p2.company
+
+    def test_slotted(self, sample_cpo_posting):
+        assert not hasattr(sample_cpo_posting, "__dict__")
+
     def test_to_dict(self, sample_cpo_posting):
         d = sample_cpo_posting.to_dict()
         assert d["title"] == "Chief Product Officer"
@@ -27,6 +48,10 @@ class TestJobPosting:
         assert d["source"] == "linkedin"
         assert d["posted_date"] is not None
 
+    def test_to_json_bytes_matches_to_dict(self, sample_cpo_posting, sample_vp_posting):
+        for posting in (sample_cpo_posting, sample_vp_posting):
+            assert orjson.loads(posting.to_json_bytes()) == posting.to_dict()
+
     def test_from_dict_roundtrip(self, sample_cpo_posting):
         d = sample_cpo_posting.to_dict()
         restored = JobPosting.from_dict(d)
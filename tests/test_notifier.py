@@ -0,0 +1,102 @@
+"""Tests for Slack notifications using a mocked Slack API."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from prospector_jobs.models import JobPosting
+from prospector_jobs.notifier import notify_slack
+
+
+class MockSlack:
+    """Stand-in for Slack's chat.postMessage, served through ``httpx.MockTransport``.
+
+    Records payloads in the order Slack would show them. Each request answers
+    a little faster than the one before, so concurrently posted messages
+    arrive out of order. Payloads whose fallback text contains ``fail_text``
+    are answered with ``ok: false``.
+    """
+
+    def __init__(self) -> None:
+        self.payloads: list[dict] = []
+        self.fail_text = ""
+        self._requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self._requests += 1
+        await asyncio.sleep(max(0.0, 0.01 - 0.002 * self._requests))
+        payload = orjson.loads(request.content)
+        self.payloads.append(payload)
+        if self.fail_text and self.fail_text in payload["text"]:
+            return httpx.Response(200, json={"ok": False, "error": "channel_not_found"})
+        return httpx.Response(200, json={"ok": True})
+
+
+@pytest.fixture
+def slack() -> MockSlack:
+    return MockSlack()
+
+
+def _lead(company: str, score: int) -> JobPosting:
+    return JobPosting(
+        title="Chief Product Officer",
+        company=company,
+        url=f"https://www.linkedin.com/jobs/view/{company}",
+        source="linkedin",
+        score=score,
+    )
+
+
+async def _notify(slack: MockSlack, postings: list[JobPosting]) -> int:
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slack.handle)) as client:
+        return await notify_slack(postings, bot_token="xoxb-test", channel_id="C1", client=client)
+
+
+class TestNotifySlack:
+    async def test_hot_leads_posted_in_score_order(self, slack):
+        postings = [_lead("Low", 80), _lead("Top", 95), _lead("Mid", 90), _lead("Digest", 50)]
+        await _notify(slack, postings)
+        hot = [p["text"].split(" — ")[0] for p in slack.payloads if p["text"].startswith("🔥")]
+        assert hot == ["🔥 Hot Lead: Top", "🔥 Hot Lead: Mid", "🔥 Hot Lead: Low"]
+
+    async def test_up_to_three_hot_leads_sent_individually(self, slack):
+        postings = [_lead(f"Co{i}", 90) for i in range(3)]
+        assert await _notify(slack, postings) == 3
+        assert len(slack.payloads) == 3
+        assert all(p["text"].startswith("🔥 Hot Lead: ") for p in slack.payloads)
+
+    async def test_many_hot_leads_batched_under_block_limit(self, slack):
+        postings = [_lead(f"Co{i}", 90) for i in range(30)]
+        # Four blocks per lead: 12 leads fit under Slack's 50-block cap
+        assert await _notify(slack, postings) == 3
+        assert [len(p["blocks"]) for p in slack.payloads] == [48, 48, 24]
+        companies = [c for p in slack.payloads for c in p["text"].split(": ")[1].split(", ")]
+        assert sorted(companies) == sorted(p.company for p in postings)
+
+    async def test_digest_counted_with_hot_leads(self, slack):
+        postings = [_lead("Hot", 90), _lead("Warm", 60), _lead("Mild", 45)]
+        assert await _notify(slack, postings) == 2
+        digest = [p for p in slack.payloads if p["text"].startswith("📊")]
+        assert len(digest) == 1
+        assert "Warm" in digest[0]["blocks"][1]["text"]["text"]
+
+    async def test_failed_digest_not_counted(self, slack):
+        slack.fail_text = "📊"
+        assert await _notify(slack, [_lead("Hot", 90), _lead("Warm", 60)]) == 1
+        assert len(slack.payloads) == 2
+
+    async def test_failed_hot_lead_not_counted(self, slack):
+        slack.fail_text = "Broken"
+        postings = [_lead("Broken", 95), _lead("Fine", 90), _lead("Warm", 60)]
+        assert await _notify(slack, postings) == 2
+
+    async def test_below_min_score_not_sent(self, slack):
+        assert await _notify(slack, [_lead("Cold", 20)]) == 0
+        assert slack.payloads == []
+
+    async def test_no_credentials(self):
+        assert await notify_slack([_lead("Hot", 90)]) == 0
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import httpx
+import asyncio
+from datetime import UTC, datetime
+
 import pytest
-import respx
+from bs4 import BeautifulSoup
 
 from prospector_jobs.scrapers.aboveboard import AboveboardScraper
-from prospector_jobs.scrapers.indeed import IndeedScraper
+from prospector_jobs.scrapers.base import RateLimiter
+from prospector_jobs.scrapers.indeed import SEARCH_TERMS, IndeedScraper
 from prospector_jobs.scrapers.linkedin import LinkedInScraper
 from prospector_jobs.scrapers.wellfound import WellfoundScraper
 
@@ -31,22 +34,179 @@ LINKEDIN_SEARCH_HTML = """
 </body></html>
 """
 
+# Describes only the first of LINKEDIN_SEARCH_HTML's two cards
+LINKEDIN_LD_JSON = """
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "JobPosting",
+ "title": "Chief Product Officer",
+ "hiringOrganization": {"@type": "Organization", "name": "Acme Corp"},
+ "jobLocation": {"@type": "Place",
+                 "address": {"addressLocality": "Austin", "addressRegion": "TX"}},
+ "datePosted": "2026-01-30T08:00:00.000Z",
+ "url": "https://www.linkedin.com/jobs/view/cpo-at-acme-123?trk=public"}
+</script>
+"""
+
+LINKEDIN_LD_JSON_HTML = LINKEDIN_SEARCH_HTML.replace(
+    "<html>", f"<html><head>{LINKEDIN_LD_JSON}</head>"
+)
+
+
+@pytest.fixture
+def scraper(request, http_client):
+    """A fresh instance of the test class's ``scraper_cls``.
+
+    Not shared between tests: its semaphore binds to the event loop it first waits on.
+    """
+    return request.cls.scraper_cls(delay=0, client=http_client)
+
+
+@pytest.fixture(scope="session")
+def linkedin_tree() -> BeautifulSoup:
+    return BeautifulSoup(LINKEDIN_SEARCH_HTML, "lxml")
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_spaces_requests(self):
+        limiter = RateLimiter(0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(limiter.wait(), limiter.wait(), limiter.wait())
+        # Third slot is two intervals out; allow for uvloop's millisecond timer rounding
+        assert loop.time() - start >= 0.1 - 0.005
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_does_not_wait(self):
+        limiter = RateLimiter(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(5):
+            await limiter.wait()
+        assert loop.time() - start < 0.05
+
+
+class TestParseTree:
+    @pytest.mark.parametrize(
+        ("scraper_cls", "tree_fixture", "expected"),
+        [
+            (
+                LinkedInScraper,
+                "linkedin_tree",
+                [
+                    {
+                        "title": "Chief Product Officer",
+                        "company": "Acme Corp",
+                        "location": "Remote",
+                        "url": "https://www.linkedin.com/jobs/view/cpo-at-acme-123",
+                        "posted_date": datetime(2026, 1, 30, tzinfo=UTC),
+                    },
+                    {"title": "VP of Product", "company": "TechStart Inc"},
+                ],
+            ),
+            (
+                IndeedScraper,
+                "indeed_tree",
+                [
+                    {
+                        "title": "Chief Product Officer",
+                        "company": "StartupCo",
+                        "location": "Remote",
+                        "url": "https://www.indeed.com/viewjob?jk=abc123",
+                    },
+                    {"title": "VP of Product", "company": "GrowthCorp"},
+                ],
+            ),
+            (
+                AboveboardScraper,
+                "aboveboard_tree",
+                [{"title": "Chief Product Officer", "company": "Enterprise Inc"}],
+            ),
+            (
+                WellfoundScraper,
+                "wellfound_tree",
+                # "Product Manager" is filtered out
+                [{"title": "Head of Product", "company": "AI Start"}],
+            ),
+        ],
+    )
+    def test_parse_tree(self, scraper_cls, tree_fixture, expected, request):
+        results = scraper_cls(delay=0)._parse_tree(request.getfixturevalue(tree_fixture))
+        assert len(results) == len(expected)
+        for posting, fields in zip(results, expected):
+            assert posting.source == scraper_cls.name
+            for name, value in fields.items():
+                assert getattr(posting, name) == value
+
 
 class TestLinkedInScraper:
-    def test_parse_results(self):
-        scraper = LinkedInScraper(delay=0)
-        results = scraper._parse_results(LINKEDIN_SEARCH_HTML)
-        assert len(results) == 2
+    scraper_cls = LinkedInScraper
 
+    def test_parse_ld_json(self, scraper):
+        results = scraper._parse_results(LINKEDIN_LD_JSON_HTML)
+        assert len(results) == 2
         assert results[0].title == "Chief Product Officer"
         assert results[0].company == "Acme Corp"
-        assert results[0].source == "linkedin"
-        assert "linkedin.com" in results[0].url
-        assert results[0].posted_date is not None
-
+        assert results[0].location == "Austin, TX"
+        assert results[0].url == "https://www.linkedin.com/jobs/view/cpo-at-acme-123"
+        assert results[0].posted_date == datetime(2026, 1, 30, tzinfo=UTC)
+        # The card JSON-LD does not describe is still read from the DOM
         assert results[1].title == "VP of Product"
         assert results[1].company == "TechStart Inc"
 
+    def test_parse_ld_json_without_company_fills_from_card(self, scraper):
+        html = LINKEDIN_LD_JSON_HTML.replace(
+            '"hiringOrganization": {"@type": "Organization", "name": "Acme Corp"},', ""
+        )
+        results = scraper._parse_results(html)
+        # Merged with the card at the same URL rather than returned twice
+        assert [(r.company, r.title) for r in results] == [
+            ("Acme Corp", "Chief Product Officer"),
+            ("TechStart Inc", "VP of Product"),
+        ]
+        assert results[0].location == "Austin, TX"
+        assert results[0].dedup_key == "acme corp|chief product officer"
+
+    def test_parse_ld_json_covering_every_card_skips_dom(self, scraper, monkeypatch):
+        vp_ld_json = (
+            LINKEDIN_LD_JSON.replace("Chief Product Officer", "VP of Product")
+            .replace("Acme Corp", "TechStart Inc")
+            .replace("cpo-at-acme-123", "vp-product-techstart-456")
+        )
+        html = LINKEDIN_LD_JSON_HTML.replace("</head>", f"{vp_ld_json}</head>")
+
+        def no_dom(soup):
+            raise AssertionError("cards should not be parsed")
+
+        monkeypatch.setattr(scraper, "_parse_tree", no_dom)
+        results = scraper._parse_results(html)
+        assert [r.company for r in results] == ["Acme Corp", "TechStart Inc"]
+
+    def test_parse_ld_json_ignores_mistyped_fields(self, scraper):
+        ld_json = """<script type="application/ld+json">
+        {"@type": "JobPosting", "title": "Head of Product",
+         "hiringOrganization": {"name": {"@value": "Beta"}},
+         "url": ["https://www.linkedin.com/jobs/view/1"], "datePosted": 20260130}
+        </script>"""
+        results = scraper._parse_results(f"<html><head>{ld_json}</head></html>")
+        assert len(results) == 1
+        assert results[0].company == "Unknown"
+        assert results[0].url == ""
+        assert results[0].posted_date is None
+
+    def test_parse_falls_back_to_dom_on_bad_ld_json(self, scraper):
+        html = LINKEDIN_SEARCH_HTML.replace(
+            "<html>", '<html><script type="application/ld+json">{not json</script>'
+        )
+        assert len(scraper._parse_results(html)) == 2
+
+    def test_parse_posted_date(self, scraper):
+        results = scraper._parse_results(LINKEDIN_SEARCH_HTML)
+        assert results[0].posted_date == datetime(2026, 1, 30, tzinfo=UTC)
+
+        bad = LINKEDIN_SEARCH_HTML.replace('datetime="2026-01-30"', 'datetime="last week"')
+        assert scraper._parse_results(bad)[0].posted_date is None
+
     def test_extract_company(self):
         assert LinkedInScraper._extract_company("CPO at Acme Corp - LinkedIn") == "Acme Corp"
         assert LinkedInScraper._extract_company("VP Product at TechStart - LinkedIn") == "TechStart"
@@ -58,101 +218,60 @@ class TestLinkedInScraper:
         )
         assert LinkedInScraper._clean_title("VP Product | LinkedIn") == "VP Product"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_scrape(self):
-        respx.get("https://www.linkedin.com/jobs/search/").mock(
-            return_value=httpx.Response(200, text=LINKEDIN_SEARCH_HTML)
-        )
-        scraper = LinkedInScraper(delay=0)
+    async def test_scrape(self, scraper, job_boards):
+        job_boards.respond("linkedin", 200, LINKEDIN_SEARCH_HTML)
         results = await scraper.scrape()
         assert len(results) > 0
         for r in results:
             assert r.source == "linkedin"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_handles_http_error(self):
-        respx.get("https://www.linkedin.com/jobs/search/").mock(
-            return_value=httpx.Response(429, text="Rate limited")
-        )
-        scraper = LinkedInScraper(delay=0)
+    async def test_handles_http_error(self, scraper, job_boards):
+        job_boards.respond("linkedin", 429, "Rate limited")
         results = await scraper.safe_scrape()
         assert results == []
 
 
 class TestIndeedScraper:
-    def test_parse_results(self, indeed_search_html):
-        scraper = IndeedScraper(delay=0)
-        results = scraper._parse_results(indeed_search_html)
-        assert len(results) == 2
-
-        assert results[0].title == "Chief Product Officer"
-        assert results[0].company == "StartupCo"
-        assert results[0].source == "indeed"
-        assert results[0].location == "Remote"
-        assert results[0].url.startswith("https://www.indeed.com/")
+    scraper_cls = IndeedScraper
 
-        assert results[1].title == "VP of Product"
-        assert results[1].company == "GrowthCorp"
-
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_scrape(self, indeed_search_html):
-        respx.get("https://www.indeed.com/jobs").mock(
-            return_value=httpx.Response(200, text=indeed_search_html)
-        )
-        scraper = IndeedScraper(delay=0)
+    async def test_scrape(self, scraper, indeed_search_html, job_boards):
+        job_boards.respond("indeed", 200, indeed_search_html)
         results = await scraper.scrape()
         assert len(results) > 0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_handles_error(self):
-        respx.get("https://www.indeed.com/jobs").mock(
-            return_value=httpx.Response(503, text="Service Unavailable")
-        )
-        scraper = IndeedScraper(delay=0)
+    async def test_scrape_searches_every_term(self, scraper, indeed_search_html, job_boards):
+        job_boards.respond("indeed", 200, indeed_search_html)
+        results = await scraper.scrape()
+        assert job_boards.calls["indeed"] == len(SEARCH_TERMS)
+        # Every term returned the same two jobs; repeats are dropped
+        assert [r.title for r in results] == ["Chief Product Officer", "VP of Product"]
+
+    @pytest.mark.asyncio
+    async def test_handles_error(self, scraper, job_boards):
+        job_boards.respond("indeed", 503, "Service Unavailable")
         results = await scraper.safe_scrape()
         assert results == []
 
 
 class TestAboveboardScraper:
-    def test_parse_results(self, aboveboard_search_html):
-        scraper = AboveboardScraper(delay=0)
-        results = scraper._parse_results(aboveboard_search_html)
-        assert len(results) == 1
-        assert results[0].title == "Chief Product Officer"
-        assert results[0].company == "Enterprise Inc"
-        assert results[0].source == "aboveboard"
+    scraper_cls = AboveboardScraper
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_scrape(self, aboveboard_search_html):
-        respx.get("https://trueplatform.com/search/").mock(
-            return_value=httpx.Response(200, text=aboveboard_search_html)
-        )
-        scraper = AboveboardScraper(delay=0)
+    async def test_scrape(self, scraper, aboveboard_search_html, job_boards):
+        job_boards.respond("aboveboard", 200, aboveboard_search_html)
         results = await scraper.scrape()
         assert len(results) == 1
 
 
 class TestWellfoundScraper:
-    def test_parse_results(self, wellfound_search_html):
-        scraper = WellfoundScraper(delay=0)
-        results = scraper._parse_results(wellfound_search_html)
-        # "Product Manager" should be filtered out
-        assert len(results) == 1
-        assert results[0].title == "Head of Product"
-        assert results[0].company == "AI Start"
-        assert results[0].source == "wellfound"
+    scraper_cls = WellfoundScraper
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_scrape(self, wellfound_search_html):
-        respx.get("https://wellfound.com/role/product-manager").mock(
-            return_value=httpx.Response(200, text=wellfound_search_html)
-        )
-        scraper = WellfoundScraper(delay=0)
+    async def test_scrape(self, scraper, wellfound_search_html, job_boards):
+        job_boards.respond("wellfound", 200, wellfound_search_html)
         results = await scraper.scrape()
         assert len(results) == 1
@@ -0,0 +1,115 @@
+"""Tests for JSON Lines storage."""
+
+from __future__ import annotations
+
+import json
+
+from prospector_jobs.models import JobPosting
+from prospector_jobs.storage import append_postings, load_postings
+
+
+class TestStorage:
+    def test_missing_file(self, tmp_path):
+        assert load_postings(tmp_path / "jobs.json") == []
+
+    def test_append_roundtrip(self, tmp_path, sample_postings):
+        path = tmp_path / "data" / "jobs.json"
+        assert append_postings(sample_postings, path) == len(sample_postings)
+
+        loaded = load_postings(path)
+        assert [p.dedup_key for p in loaded] == [p.dedup_key for p in sample_postings]
+        assert loaded[0].posted_date == sample_postings[0].posted_date
+
+    def test_append_writes_only_new_lines(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting], path)
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["title"] == "VP of Product"
+
+    def test_migrates_legacy_array(self, tmp_path, sample_cpo_posting):
+        path = tmp_path / "jobs.json"
+        path.write_text(json.dumps([sample_cpo_posting.to_dict()], indent=2))
+        assert len(load_postings(path)) == 1
+
+        new = JobPosting(title="CPTO", company="NewCo", url="url", source="indeed")
+        assert append_postings([new], path) == 2
+        assert len(path.read_text().splitlines()) == 2
+        assert len(path.with_suffix(".keys").read_text().splitlines()) == 2
+        assert [p.company for p in load_postings(path)] == ["Acme Corp", "NewCo"]
+
+    def test_append_reads_keys_sidecar(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting], path)
+        # A corrupt data line proves the existing postings are not re-parsed
+        with path.open("a") as f:
+            f.write("not json\n")
+
+        assert append_postings([sample_cpo_posting, sample_vp_posting], path) == 2
+
+    def test_rebuilds_missing_keys_sidecar(self, tmp_path, sample_cpo_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting], path)
+        path.with_suffix(".keys").unlink()
+
+        assert append_postings([sample_cpo_posting], path) == 1
+        assert path.with_suffix(".keys").exists()
+
+    def test_discards_stale_keys_sidecar(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+        path.unlink()
+
+        assert append_postings([sample_cpo_posting], path) == 1
+        assert append_postings([sample_vp_posting], path) == 2
+        assert [p.title for p in load_postings(path)] == [
+            sample_cpo_posting.title,
+            sample_vp_posting.title,
+        ]
+
+    def test_skips_torn_last_line(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+        path.write_bytes(path.read_bytes()[:-20])  # Crash part-way through the last record
+
+        assert [p.title for p in load_postings(path)] == [sample_cpo_posting.title]
+
+    def test_append_after_torn_line_starts_new_line(
+        self, tmp_path, sample_cpo_posting, sample_vp_posting, sample_head_posting
+    ):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+        path.write_bytes(path.read_bytes()[:-20])
+
+        append_postings([sample_head_posting], path)
+        titles = [p.title for p in load_postings(path)]
+        assert titles == [sample_cpo_posting.title, sample_head_posting.title]
+
+    def test_rebuilt_sidecar_skips_torn_line(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+        path.write_bytes(path.read_bytes()[:-20])
+        path.with_suffix(".keys").unlink()
+
+        # The readable posting is not stored a second time
+        assert append_postings([sample_cpo_posting], path) == 1
+        assert [p.title for p in load_postings(path)] == [sample_cpo_posting.title]
+
+    def test_unreadable_store_not_appended(self, tmp_path, sample_cpo_posting):
+        path = tmp_path / "jobs.json"
+        path.write_bytes(b'[{"title": "Chief Product')
+
+        assert append_postings([sample_cpo_posting], path) == 0
+        assert path.read_bytes() == b'[{"title": "Chief Product'
+        assert not path.with_suffix(".keys").exists()
+
+    def test_rebuilds_torn_keys_sidecar(self, tmp_path, sample_cpo_posting, sample_vp_posting):
+        path = tmp_path / "jobs.json"
+        append_postings([sample_cpo_posting, sample_vp_posting], path)
+        keys_path = path.with_suffix(".keys")
+        keys_path.write_bytes(keys_path.read_bytes()[:-5])
+
+        assert append_postings([sample_vp_posting], path) == 2
+        assert len(load_postings(path)) == 2